@@ -43,22 +43,26 @@ def test_tesseract():
     """Test if Tesseract is installed and has Thai support"""
     print("\nTesting Tesseract...")
 
-    import subprocess
+    try:
+        import pytesseract
+    except ImportError as e:
+        print(f"  ✗ pytesseract: {e}")
+        return False
 
     try:
         # Check if tesseract command exists
-        result = subprocess.run(['tesseract', '--version'],
-                              capture_output=True, text=True)
-        print(f"  ✓ Tesseract installed: {result.stdout.split()[1]}")
-    except FileNotFoundError:
+        version = pytesseract.get_tesseract_version()
+        print(f"  ✓ Tesseract installed: {version}")
+    except pytesseract.TesseractNotFoundError:
         print("  ✗ Tesseract not found. Install with: sudo apt-get install tesseract-ocr")
         return False
+    except Exception as e:
+        print(f"  ✗ Error running Tesseract: {e}")
+        return False
 
     try:
         # Check for Thai language support
-        result = subprocess.run(['tesseract', '--list-langs'],
-                              capture_output=True, text=True)
-        if 'tha' in result.stdout:
+        if 'tha' in pytesseract.get_languages(config=''):
             print("  ✓ Thai language support available")
             return True
         else:
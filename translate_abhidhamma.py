@@ -7,10 +7,19 @@ Preserves Pali terms where applicable
 
 import os
 import sys
+import hashlib
+import shelve
+import shutil
+import threading
+import subprocess
+import tempfile
 from pathlib import Path
 import json
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, repeat
+from functools import lru_cache
 
 try:
     import fitz  # PyMuPDF
@@ -40,6 +49,398 @@ except ImportError:
     os.system("pip install deep-translator")
     from deep_translator import GoogleTranslator
 
+# OCR already runs one worker per core, so each libtesseract must stay
+# single-threaded. OpenMP reads this when the library loads, i.e. on import;
+# setting it here covers forked workers (which inherit the loaded library)
+# as well as spawned ones (which re-import this module).
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+try:
+    # Optional: binds libtesseract directly so the model is loaded only once
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+try:
+    # Optional: Aho-Corasick automaton for single-pass Pali term matching
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional: RE2 compiles the Pali term alternation to a DFA
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    # Optional: Hyperscan SIMD multi-pattern matcher for Pali term detection
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    # Optional: C JSON serializer for the per-page records
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Page rasterization zoom for OCR. 1.5x grayscale is enough for printed Thai;
+# pages whose mean word confidence comes out below MIN_OCR_CONFIDENCE are
+# re-rendered at OCR_FALLBACK_ZOOM.
+OCR_ZOOM = 1.5
+OCR_FALLBACK_ZOOM = 2
+MIN_OCR_CONFIDENCE = 60
+
+# Pages per tesseract invocation when OCR falls back to the CLI (no tesserocr)
+OCR_BATCH_SIZE = 12
+
+# Optional cheap pre-pass, off by default: when QUICK_SCAN_DPI is set (e.g. 75),
+# pages whose render at that DPI yields no word above QUICK_SCAN_MIN_CONFIDENCE
+# (blanks, figures) skip the full-resolution OCR. The DPI is in scan pixels
+# (capped at the page image's own resolution), not PDF points. Only worth it
+# for PDFs with many blank pages; the bundled books have text on nearly all.
+QUICK_SCAN_DPI = None
+QUICK_SCAN_MIN_CONFIDENCE = 30
+QUICK_SCAN_CONFIG = '--oem 1 --psm 3'
+
+# Gray level above which a pixel is treated as paper when binarizing
+BINARIZE_THRESHOLD = 180
+
+# Tesseract settings: LSTM engine, single uniform block of text
+TESSERACT_LANG = 'tha+eng'
+TESSERACT_CONFIG = '--oem 1 --psm 6'
+
+# Concurrent translation requests per page (network-bound, so threads suffice)
+TRANSLATE_WORKERS = 8
+
+# Write buffer for the output files, so pages reach disk in few syscalls
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+# Placeholder a Pali term is swapped for during translation, e.g. ⟪T3⟫;
+# restoring tolerates the spaces the translator sometimes inserts
+PALI_PLACEHOLDER = "⟪T{}⟫"
+PALI_PLACEHOLDER_RE = re.compile(r"⟪\s*T\s*(\d+)\s*⟫")
+
+
+# Per-process tesserocr API, created on first use (see _get_tess_api). It lives
+# as long as the worker; pool workers leave via os._exit, which skips atexit,
+# so it is never End()ed explicitly and the OS frees it with the process
+_tess_api = None
+
+
+def _get_tess_api():
+    """Return this process's persistent Tesseract API, or None without tesserocr"""
+    global _tess_api
+    if tesserocr is None:
+        return None
+    if _tess_api is None:
+        _tess_api = tesserocr.PyTessBaseAPI(lang=TESSERACT_LANG,
+                                            psm=tesserocr.PSM.SINGLE_BLOCK,
+                                            oem=tesserocr.OEM.LSTM_ONLY)
+    return _tess_api
+
+
+def _set_tess_image(api, page_image: Image.Image):
+    """Hand an 'L' or '1' image to Tesseract as raw pixels
+
+    PyTessBaseAPI.SetImage would encode the PIL image to PNG and have
+    Leptonica decode it again; SetImageBytes takes the buffer as is.
+    """
+    if page_image.mode == '1':
+        # Packed bits, MSB first, rows padded to whole bytes, 1 = white
+        bytes_per_pixel, bytes_per_line = 0, (page_image.width + 7) // 8
+    else:
+        bytes_per_pixel = len(page_image.getbands())
+        bytes_per_line = page_image.width * bytes_per_pixel
+    api.SetImageBytes(page_image.tobytes(), page_image.width, page_image.height,
+                      bytes_per_pixel, bytes_per_line)
+
+
+def _run_ocr(page_image: Image.Image) -> Tuple[str, Optional[float]]:
+    """OCR one page image, raising if Tesseract fails
+
+    Returns the text and Tesseract's mean word confidence (0-100), or None
+    for the confidence when it isn't available without a second OCR pass.
+    """
+    # Use Tesseract with Thai language
+    # You may need to install Thai language data: sudo apt-get install tesseract-ocr-tha
+    api = _get_tess_api()
+    if api is not None:
+        # Reuse the loaded model instead of spawning tesseract per page
+        _set_tess_image(api, page_image)
+        return api.GetUTF8Text().strip(), api.MeanTextConf()
+
+    text = pytesseract.image_to_string(page_image, lang=TESSERACT_LANG,
+                                       config=TESSERACT_CONFIG)
+    return text.strip(), None
+
+
+def _ocr_image(page_image: Image.Image) -> str:
+    """Extract Thai text from page image using OCR"""
+    try:
+        return _run_ocr(page_image)[0]
+    except Exception as e:
+        print(f"OCR Error: {e}")
+        return ""
+
+
+def _quick_scan(page_image: Image.Image) -> bool:
+    """True if a fast full-page OCR pass finds at least one confident word
+
+    Only used with tesserocr; the CLI path scans whole batches instead.
+    """
+    api = _get_tess_api()
+    # Automatic layout analysis for this pass, then back to a single block
+    api.SetPageSegMode(tesserocr.PSM.AUTO)
+    try:
+        _set_tess_image(api, page_image)
+        confidences = api.AllWordConfidences()
+    finally:
+        api.SetPageSegMode(tesserocr.PSM.SINGLE_BLOCK)
+
+    return any(conf > QUICK_SCAN_MIN_CONFIDENCE for conf in confidences)
+
+
+def _quick_scan_zoom(page: fitz.Page) -> float:
+    """Render zoom that puts the page's scan at QUICK_SCAN_DPI
+
+    Scanned pages are one big image, so its pixels per point give the
+    scan's real resolution; never render finer than that.
+    """
+    scan_dpi = None
+    images = [info for info in page.get_image_info()
+              if info['bbox'][2] > info['bbox'][0]]
+    if images:
+        largest = max(images, key=lambda info: info['width'] * info['height'])
+        bbox = largest['bbox']
+        scan_dpi = largest['width'] / (bbox[2] - bbox[0]) * 72
+
+    dpi = min(QUICK_SCAN_DPI, scan_dpi) if scan_dpi else QUICK_SCAN_DPI
+    return dpi / 72
+
+
+def _mean_confidence(confidences: List[float]) -> float:
+    """Mean word confidence, 0 when no words were found"""
+    return sum(confidences) / len(confidences) if confidences else 0.0
+
+
+def _needs_fallback(text: str, confidence: Optional[float], zoom: float) -> bool:
+    """True if an OCR result is poor enough to retry at OCR_FALLBACK_ZOOM"""
+    return (bool(text) and confidence is not None and
+            confidence < MIN_OCR_CONFIDENCE and zoom < OCR_FALLBACK_ZOOM)
+
+
+@lru_cache(maxsize=None)
+def _zoom_matrix(zoom: float) -> fitz.Matrix:
+    """Render matrix for a zoom factor, built once and shared by every page"""
+    return fitz.Matrix(zoom, zoom)
+
+
+def _render_gray(doc: fitz.Document, page_num: int, zoom: float) -> Image.Image:
+    """Rasterize one page to a grayscale image"""
+    # Render grayscale directly; Tesseract would convert RGB anyway
+    pix = doc[page_num].get_pixmap(matrix=_zoom_matrix(zoom),
+                                   colorspace=fitz.csGRAY, alpha=False)
+
+    # Build the image straight from the raw samples instead of a PNG round-trip
+    return Image.frombytes("L", (pix.width, pix.height), pix.samples)
+
+
+def _render_page(doc: fitz.Document, page_num: int, zoom: float) -> Image.Image:
+    """Rasterize one page to a binarized image ready for OCR"""
+    # Binarize so Tesseract can skip its own thresholding pass
+    img = _render_gray(doc, page_num, zoom)
+    return img.point(lambda p: 255 if p > BINARIZE_THRESHOLD else 0, mode='1')
+
+
+def _page_cache_key(doc: fitz.Document, page_num: int, zoom: float) -> str:
+    """Hash of everything that determines a page's OCR output"""
+    page = doc[page_num]
+    digest = hashlib.sha1(page.read_contents())
+
+    # Scanned pages share near-identical content streams, so the key has to
+    # cover the embedded images themselves
+    for image in page.get_images(full=True):
+        digest.update(doc.xref_stream_raw(image[0]) or b"")
+
+    digest.update(f"{page.rect}|{page.rotation}|{zoom}|{OCR_FALLBACK_ZOOM}|"
+                  f"{MIN_OCR_CONFIDENCE}|{QUICK_SCAN_DPI}|{QUICK_SCAN_MIN_CONFIDENCE}|"
+                  f"{QUICK_SCAN_CONFIG}|{BINARIZE_THRESHOLD}|"
+                  f"{TESSERACT_LANG}|{TESSERACT_CONFIG}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _ocr_page(pdf_path: str, page_num: int,
+              zoom: float = OCR_ZOOM) -> Tuple[int, Optional[str]]:
+    """Rasterize and OCR a single page (runs in a worker process)
+
+    The text is None when OCR failed, so the caller won't cache the failure.
+    """
+    # Each worker opens its own document; fitz objects can't cross processes
+    with fitz.open(pdf_path) as doc:
+        try:
+            if QUICK_SCAN_DPI and not _quick_scan(
+                    _render_gray(doc, page_num, _quick_scan_zoom(doc[page_num]))):
+                # Blank or figure-only page: skip the full-resolution pass
+                return page_num, ""
+
+            text, confidence = _run_ocr(_render_page(doc, page_num, zoom))
+
+            if _needs_fallback(text, confidence, zoom):
+                retry_text, retry_confidence = _run_ocr(
+                    _render_page(doc, page_num, OCR_FALLBACK_ZOOM))
+                if retry_confidence is not None and retry_confidence > confidence:
+                    text = retry_text
+        except Exception as e:
+            print(f"OCR Error: {e}")
+            return page_num, None
+
+    return page_num, text
+
+
+def _tesseract_batch(images: Iterable[Image.Image],
+                     config: str = TESSERACT_CONFIG) -> Optional[List[Tuple[str, List[float]]]]:
+    """OCR several images with one tesseract invocation
+
+    Tesseract accepts a text file listing image paths, so the process
+    startup and model load are paid once for the whole list. Each image is
+    written out as soon as the iterable yields it, so only one page is held
+    in memory at a time. Returns the text and word confidences of each
+    image, or None if tesseract failed; errors raised while producing or
+    saving an image propagate to the caller.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+
+        image_paths = []
+        for i, img in enumerate(images):
+            image_path = tmp_path / f"page_{i}.png"
+            img.save(image_path)
+            image_paths.append(str(image_path))
+
+        if not image_paths:
+            return []
+
+        list_file = tmp_path / "filelist.txt"
+        list_file.write_text("\n".join(image_paths) + "\n", encoding='utf-8')
+        out_base = tmp_path / "output"
+
+        try:
+            # Inherits OMP_THREAD_LIMIT from os.environ (set at import)
+            subprocess.run(
+                [pytesseract.pytesseract.tesseract_cmd, str(list_file), str(out_base),
+                 '-l', TESSERACT_LANG] + config.split() + ['txt', 'tsv'],
+                check=True, capture_output=True,
+            )
+            output = out_base.with_suffix(".txt").read_text(encoding='utf-8')
+            tsv = out_base.with_suffix(".tsv").read_text(encoding='utf-8')
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"OCR Error: {e}")
+            return None
+
+    # Word confidences per image; TSV page numbers are 1-based list positions
+    image_count = len(image_paths)
+    word_confs = [[] for _ in range(image_count)]
+    for row in tsv.splitlines():
+        fields = row.split("\t")
+        if len(fields) < 11 or not fields[1].isdigit():
+            continue
+        page_index, conf = int(fields[1]) - 1, float(fields[10])
+        if conf >= 0 and 0 <= page_index < image_count:
+            word_confs[page_index].append(conf)
+
+    # Tesseract ends every page's text with a form feed
+    texts = output.split("\f")
+    return [
+        (texts[i].strip() if i < len(texts) else "", word_confs[i])
+        for i in range(image_count)
+    ]
+
+
+def _ocr_page_batch(pdf_path: str, page_nums: List[int],
+                    zoom: float = OCR_ZOOM) -> List[Tuple[int, Optional[str]]]:
+    """Rasterize a run of pages and OCR them with one tesseract invocation
+
+    Used when tesserocr is unavailable (runs in a worker process on at most
+    OCR_BATCH_SIZE pages). The quick scan and the low-confidence retry are
+    batched the same way.
+    """
+    with fitz.open(pdf_path) as doc:
+        # Rendering and saving happen lazily inside _tesseract_batch, so they
+        # are covered here too: a failure costs only this batch
+        try:
+            text_pages = list(page_nums)
+            if QUICK_SCAN_DPI:
+                scans = _tesseract_batch((_render_gray(doc, page_num, _quick_scan_zoom(doc[page_num]))
+                                          for page_num in page_nums), QUICK_SCAN_CONFIG)
+                if scans is None:
+                    return [(page_num, None) for page_num in page_nums]
+                # Blank or figure-only pages skip the full-resolution pass
+                text_pages = [page_num for page_num, (_, confidences) in zip(page_nums, scans)
+                              if any(conf > QUICK_SCAN_MIN_CONFIDENCE for conf in confidences)]
+
+            batch = _tesseract_batch(_render_page(doc, page_num, zoom)
+                                     for page_num in text_pages)
+            if batch is None:
+                return [(page_num, None) for page_num in page_nums]
+            results = [(text, _mean_confidence(confidences)) for text, confidences in batch]
+
+            retry = [i for i, (text, confidence) in enumerate(results)
+                     if _needs_fallback(text, confidence, zoom)]
+            if retry:
+                retried = _tesseract_batch(_render_page(doc, text_pages[i], OCR_FALLBACK_ZOOM)
+                                           for i in retry)
+                for i, (text, confidences) in zip(retry, retried or []):
+                    confidence = _mean_confidence(confidences)
+                    if confidence > results[i][1]:
+                        results[i] = (text, confidence)
+        except Exception as e:
+            print(f"OCR Error: {e}")
+            return [(page_num, None) for page_num in page_nums]
+
+    texts = {page_num: text for page_num, (text, _) in zip(text_pages, results)}
+    return [(page_num, texts.get(page_num, "")) for page_num in page_nums]
+
+
+def _dumps_json(obj, indent: bool = False) -> str:
+    """Serialize to JSON text (UTF-8, not ASCII-escaped), via orjson if available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
+def _loads_json(text: str):
+    """Parse JSON text, via orjson if available"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _compile_regex(pattern: str):
+    """Compile a pattern with RE2 when available, else with the re module"""
+    if re2 is not None:
+        return re2.compile(pattern)
+    # RE2's \b only considers ASCII word characters; match that behaviour
+    return re.compile(pattern, re.ASCII)
+
+
+def _is_word_char(ch: str) -> bool:
+    """True for characters that continue a word for the \b boundary"""
+    return ch.isascii() and (ch.isalnum() or ch == '_')
+
+
+def _whole_word_pattern(term: str) -> str:
+    """Regex for term as a whole word
+
+    \b is only added next to ASCII word characters: a \b beside a diacritic
+    (e.g. after 'cittaṃ') would demand a letter there instead of a space.
+    """
+    return ((r"\b" if _is_word_char(term[0]) else "") + re.escape(term) +
+            (r"\b" if _is_word_char(term[-1]) else ""))
+
 
 class AbhidhammaTranslator:
     """Translator for Thai Abhidhamma texts with Pali term preservation"""
@@ -76,73 +477,231 @@ class AbhidhammaTranslator:
         # Initialize translator
         self.translator = GoogleTranslator(source='th', target='en')
 
+        # Persistent translation cache keyed by SHA-1 of the source chunk,
+        # so re-runs and repeated boilerplate skip the network round-trip
+        self._cache = shelve.open(str(self.output_dir / ".trcache.db"))
+
+        # One long-lived pool for chunk translation. GoogleTranslator keeps
+        # request state on the instance, so each pool thread creates its own
+        # once and reuses it for every later chunk
+        self._translate_executor = ThreadPoolExecutor(max_workers=TRANSLATE_WORKERS)
+        self._thread_local = threading.local()
+
         # Base name for output files
         self.base_name = self.pdf_path.stem
 
+        # Pages are streamed to these while processing; save_results turns
+        # them into the final JSON and bilingual text files
+        self.pages_file = self.output_dir / f"{self.base_name}_translation.jsonl"
+        self._text_body_file = self.output_dir / f"{self.base_name}_translation.txt.part"
+        self._english_part_file = self.output_dir / f"{self.base_name}_english.txt.part"
+
+        # Lowercased form of each term, mapped back to its PALI_TERMS spelling
+        self._pali_lower = {term.lower(): term for term in self.PALI_TERMS}
+
+        # Build the Pali term matchers once so each page is scanned in one pass.
+        # Terms match as whole (ASCII) words, so Pali written inside Thai text
+        # is found but 'rupa' isn't reported for every 'arupavacara'.
+        # (longest first, so a compound entry wins over a term inside it)
+        self._pali_re = _compile_regex(
+            r"(?i)(" +
+            "|".join(map(_whole_word_pattern,
+                         sorted(self.PALI_TERMS, key=len, reverse=True))) +
+            r")"
+        )
+        self._pali_hs = None
+        self._pali_ac = None
+        if hyperscan is not None:
+            # One database of whole-word patterns; pattern ids index _pali_hs_terms.
+            # UTF8 lets terms with diacritics compile; without UCP, Hyperscan's
+            # \b stays ASCII-only, like RE2 and _is_word_char.
+            self._pali_hs_terms = list(self._pali_lower.values())
+            self._pali_hs = hyperscan.Database()
+            self._pali_hs.compile(
+                expressions=[_whole_word_pattern(term_lower).encode('utf-8')
+                             for term_lower in self._pali_lower],
+                ids=list(range(len(self._pali_hs_terms))),
+                elements=len(self._pali_hs_terms),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH |
+                       hyperscan.HS_FLAG_UTF8] * len(self._pali_hs_terms),
+            )
+        elif ahocorasick is not None:
+            self._pali_ac = ahocorasick.Automaton()
+            for term_lower in self._pali_lower:
+                self._pali_ac.add_word(term_lower, term_lower)
+            self._pali_ac.make_automaton()
+
     def extract_text_from_page(self, page_image: Image.Image) -> str:
         """Extract Thai text from page image using OCR"""
-        try:
-            # Use Tesseract with Thai language
-            # You may need to install Thai language data: sudo apt-get install tesseract-ocr-tha
-            text = pytesseract.image_to_string(page_image, lang='tha+eng')
-            return text.strip()
-        except Exception as e:
-            print(f"OCR Error: {e}")
-            return ""
+        return _ocr_image(page_image)
 
     def identify_pali_terms(self, text: str) -> List[str]:
         """Identify Pali terms in the text"""
-        found_terms = []
-        text_lower = text.lower()
+        if self._pali_hs is not None:
+            found_terms = set()
+
+            def on_match(term_id, start, end, flags, context):
+                found_terms.add(self._pali_hs_terms[term_id])
+
+            self._pali_hs.scan(text.encode('utf-8'), match_event_handler=on_match)
+            return list(found_terms)
+
+        if self._pali_ac is not None:
+            text_lower = text.lower()
+            found_terms = set()
+            for end, term_lower in self._pali_ac.iter(text_lower):
+                start = end - len(term_lower) + 1
+                # Same rule as _whole_word_pattern: only word-character edges need a boundary
+                if ((not _is_word_char(term_lower[0]) or start == 0 or
+                     not _is_word_char(text_lower[start - 1])) and
+                        (not _is_word_char(term_lower[-1]) or end + 1 == len(text_lower) or
+                         not _is_word_char(text_lower[end + 1]))):
+                    found_terms.add(self._pali_lower[term_lower])
+            return list(found_terms)
+
+        return list({self._pali_lower[match.lower()] for match in self._pali_re.findall(text)})
+
+    @staticmethod
+    def _cache_key(chunk: str) -> str:
+        """Translation cache key for a chunk of source text"""
+        return hashlib.sha1(chunk.encode('utf-8')).hexdigest()
+
+    def _translate_chunk(self, chunk: str) -> str:
+        """Translate one API-sized chunk, consulting the on-disk cache first"""
+        key = self._cache_key(chunk)
+        if key in self._cache:
+            return self._cache[key]
+
+        translated = self.translator.translate(chunk)
+        self._cache[key] = translated
+        return translated
+
+    def _translate_in_thread(self, chunk: str) -> str:
+        """Translate a chunk with the calling thread's own translator"""
+        translator = getattr(self._thread_local, "translator", None)
+        if translator is None:
+            translator = GoogleTranslator(source=self.translator.source,
+                                          target=self.translator.target)
+            self._thread_local.translator = translator
+        return translator.translate(chunk)
+
+    def _translate_chunks(self, chunks: List[str]) -> List[str]:
+        """Translate chunks concurrently, preserving order
+
+        Cache lookups and stores stay on the calling thread (shelve is not
+        thread-safe); only the cache misses are sent out in parallel.
+        """
+        translated = [None] * len(chunks)
+        keys = [self._cache_key(chunk) for chunk in chunks]
+        pending = []
+
+        for i, key in enumerate(keys):
+            if key in self._cache:
+                translated[i] = self._cache[key]
+            else:
+                pending.append(i)
+
+        if pending:
+            futures = [(i, self._translate_executor.submit(self._translate_in_thread, chunks[i]))
+                       for i in pending]
+
+            for i, future in futures:
+                try:
+                    translated[i] = future.result()
+                    self._cache[keys[i]] = translated[i]
+                except Exception as e:
+                    print(f"Translation error for chunk: {e}")
+                    translated[i] = "[Translation failed]"
+
+        return translated
+
+    @staticmethod
+    def _split_chunks(text: str, chunk_size: int) -> List[str]:
+        """Greedily pack whole lines into chunks of at most chunk_size characters"""
+        chunks = []
+        current_chunk = ""
+
+        for line in text.split('\n'):
+            piece = line + "\n"
+            if len(current_chunk) + len(piece) <= chunk_size:
+                current_chunk += piece
+                continue
+
+            if current_chunk:
+                chunks.append(current_chunk)
+
+            # A single overlong line is cut at the last space (or hard) so no
+            # chunk goes over the API limit
+            while len(piece) > chunk_size:
+                cut = piece.rfind(" ", 0, chunk_size) + 1 or chunk_size
+                chunks.append(piece[:cut])
+                piece = piece[cut:]
+            current_chunk = piece
+
+        # Keep remaining chunk
+        if current_chunk:
+            chunks.append(current_chunk)
+
+        return chunks
 
-        for term in self.PALI_TERMS:
-            if term.lower() in text_lower:
-                found_terms.append(term)
+    def _protect_pali_terms(self, text: str) -> Tuple[str, List[str]]:
+        """Swap Pali terms for placeholders the translator will leave alone
 
-        return list(set(found_terms))
+        Returns the protected text and the original terms, indexed by
+        placeholder number (a repeated term reuses its placeholder).
+        """
+        terms = []
+        indices = {}
+
+        def placeholder(match):
+            term = match.group(0)
+            if term not in indices:
+                indices[term] = len(terms)
+                terms.append(term)
+            return PALI_PLACEHOLDER.format(indices[term])
+
+        return self._pali_re.sub(placeholder, text), terms
+
+    @staticmethod
+    def _restore_pali_terms(text: str, terms: List[str]) -> str:
+        """Put the original Pali terms back in place of their placeholders"""
+        if not terms:
+            return text
+
+        def original(match):
+            index = int(match.group(1))
+            return terms[index] if index < len(terms) else match.group(0)
+
+        return PALI_PLACEHOLDER_RE.sub(original, text)
 
     def translate_text(self, text: str, chunk_size: int = 4500) -> str:
         """Translate Thai text to English in chunks (API has size limits)"""
         if not text.strip():
             return ""
 
+        # Keep Google from translating the Pali terms themselves
+        text, pali_terms = self._protect_pali_terms(text)
+
         # Split text into chunks if too long
         if len(text) <= chunk_size:
             try:
-                return self.translator.translate(text)
+                translated = self._translate_chunk(text)
             except Exception as e:
                 print(f"Translation error: {e}")
                 return f"[Translation failed: {str(e)}]"
+        else:
+            # Process in chunks
+            translated = "\n".join(self._translate_chunks(self._split_chunks(text, chunk_size)))
 
-        # Process in chunks
-        sentences = text.split('\n')
-        translated_chunks = []
-        current_chunk = ""
-
-        for sentence in sentences:
-            if len(current_chunk) + len(sentence) < chunk_size:
-                current_chunk += sentence + "\n"
-            else:
-                if current_chunk:
-                    try:
-                        translated_chunks.append(self.translator.translate(current_chunk))
-                    except Exception as e:
-                        print(f"Translation error for chunk: {e}")
-                        translated_chunks.append(f"[Translation failed]")
-                current_chunk = sentence + "\n"
-
-        # Translate remaining chunk
-        if current_chunk:
-            try:
-                translated_chunks.append(self.translator.translate(current_chunk))
-            except Exception as e:
-                print(f"Translation error for final chunk: {e}")
-                translated_chunks.append(f"[Translation failed]")
-
-        return "\n".join(translated_chunks)
+        return self._restore_pali_terms(translated, pali_terms)
 
     def process_pdf(self, max_pages: Optional[int] = None) -> Dict:
-        """Process entire PDF and extract + translate text"""
+        """Process entire PDF and extract + translate text
+
+        Pages are streamed to intermediate files rather than kept in memory,
+        so the returned summary has no "pages" entry; pass it to save_results
+        to produce the output files, which hold the pages.
+        """
         print(f"\n{'='*70}")
         print(f"Processing: {self.pdf_path.name}")
         print(f"{'='*70}\n")
@@ -156,6 +715,19 @@ class AbhidhammaTranslator:
         total_pages = len(doc)
         pages_to_process = min(max_pages, total_pages) if max_pages else total_pages
 
+        # OCR results are cached per page content, so re-runs skip straight
+        # to translation for pages that were already OCR'd
+        ocr_cache_dir = self.output_dir / ".ocr_cache"
+        ocr_cache_dir.mkdir(exist_ok=True)
+        ocr_cache_files = [
+            ocr_cache_dir / f"{_page_cache_key(doc, page_num, OCR_ZOOM)}.txt"
+            for page_num in range(pages_to_process)
+        ]
+        doc.close()
+
+        pages_to_ocr = [page_num for page_num in range(pages_to_process)
+                        if not ocr_cache_files[page_num].exists()]
+
         print(f"Total pages: {total_pages}")
         print(f"Processing: {pages_to_process} pages\n")
 
@@ -163,71 +735,177 @@ class AbhidhammaTranslator:
             "source_file": self.pdf_path.name,
             "total_pages": total_pages,
             "processed_pages": pages_to_process,
-            "pages": []
         }
 
         all_pali_terms = set()
 
-        for page_num in range(pages_to_process):
-            print(f"Processing page {page_num + 1}/{pages_to_process}...", end=" ")
-
-            page = doc[page_num]
-
-            # Convert page to image
-            pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x zoom for better OCR
-            img_data = pix.tobytes("png")
+        # Each page is written out as soon as it is translated instead of
+        # being held in memory until save_results
+        with open(self.pages_file, 'w', encoding='utf-8',
+                  buffering=OUTPUT_BUFFER_SIZE) as pages_out, \
+                open(self._text_body_file, 'w', encoding='utf-8',
+                     buffering=OUTPUT_BUFFER_SIZE) as text_out, \
+                open(self._english_part_file, 'w', encoding='utf-8',
+                     buffering=OUTPUT_BUFFER_SIZE) as eng_out:
+            eng_out.write(f"English Translation of: {results['source_file']}\n")
+            eng_out.write(f"{'='*70}\n\n")
+
+            for page_data in self._process_pages(pages_to_process, ocr_cache_files,
+                                                 pages_to_ocr):
+                all_pali_terms.update(page_data["pali_terms"])
+
+                pages_out.write(_dumps_json(page_data) + "\n")
+                self._write_page_text(text_out, page_data)
+                self._write_page_english(eng_out, page_data)
+
+                # The JSONL record is what save_results rebuilds from, so only it
+                # is pushed out per page; the text files ride their buffers
+                pages_out.flush()
 
-            # Open with PIL
-            from io import BytesIO
-            img = Image.open(BytesIO(img_data))
+        results["all_pali_terms"] = sorted(list(all_pali_terms))
 
-            # Extract text via OCR
-            thai_text = self.extract_text_from_page(img)
+        return results
 
-            if not thai_text.strip():
-                print("No text extracted")
-                results["pages"].append({
+    def _process_pages(self, pages_to_process: int, ocr_cache_files: List[Path],
+                       pages_to_ocr: List[int]) -> Iterator[Dict]:
+        """OCR and translate pages in order, yielding one record per page"""
+        ocr_pending = set(pages_to_ocr)
+
+        # OCR is CPU-bound (one tesseract process per page), so pages are
+        # rasterized and OCR'd in parallel worker processes. Translation stays
+        # in this process, one page at a time, to avoid hammering Google.
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            if tesserocr is not None:
+                ocr_results = executor.map(
+                    _ocr_page,
+                    repeat(str(self.pdf_path)),
+                    pages_to_ocr,
+                    repeat(OCR_ZOOM),
+                    chunksize=4,
+                )
+            else:
+                # Without tesserocr, OCR runs of OCR_BATCH_SIZE pages so tesseract
+                # starts once per batch rather than per page, while early pages
+                # still reach translation soon and a failure only costs one batch
+                batches = [pages_to_ocr[start:start + OCR_BATCH_SIZE]
+                           for start in range(0, len(pages_to_ocr), OCR_BATCH_SIZE)]
+                ocr_results = chain.from_iterable(executor.map(
+                    _ocr_page_batch,
+                    repeat(str(self.pdf_path)),
+                    batches,
+                    repeat(OCR_ZOOM),
+                ))
+
+            for page_num in range(pages_to_process):
+                print(f"Processing page {page_num + 1}/{pages_to_process}...", end=" ")
+
+                cache_file = ocr_cache_files[page_num]
+                if page_num in ocr_pending:
+                    # Pool results arrive in the same order as pages_to_ocr
+                    _, thai_text = next(ocr_results)
+                    if thai_text is None:
+                        thai_text = ""
+                    else:
+                        cache_file.write_text(thai_text, encoding='utf-8')
+                else:
+                    thai_text = cache_file.read_text(encoding='utf-8')
+
+                if not thai_text.strip():
+                    print("No text extracted")
+                    yield {
+                        "page": page_num + 1,
+                        "thai_text": "",
+                        "english_text": "",
+                        "pali_terms": []
+                    }
+                    continue
+
+                # Identify Pali terms
+                pali_terms = self.identify_pali_terms(thai_text)
+
+                # Translate to English
+                english_text = self.translate_text(thai_text)
+
+                print(f"✓ Extracted {len(thai_text)} chars, found {len(pali_terms)} Pali terms")
+
+                yield {
                     "page": page_num + 1,
-                    "thai_text": "",
-                    "english_text": "",
-                    "pali_terms": []
-                })
-                continue
-
-            # Identify Pali terms
-            pali_terms = self.identify_pali_terms(thai_text)
-            all_pali_terms.update(pali_terms)
-
-            # Translate to English
-            english_text = self.translate_text(thai_text)
-
-            print(f"✓ Extracted {len(thai_text)} chars, found {len(pali_terms)} Pali terms")
-
-            results["pages"].append({
-                "page": page_num + 1,
-                "thai_text": thai_text,
-                "english_text": english_text,
-                "pali_terms": pali_terms
-            })
-
-        doc.close()
+                    "thai_text": thai_text,
+                    "english_text": english_text,
+                    "pali_terms": pali_terms
+                }
+
+    @staticmethod
+    def _write_page_text(f, page_data: Dict):
+        """Write one page of the bilingual text output"""
+        parts = [f"\n--- Page {page_data['page']} ---\n\n"]
+
+        if page_data.get('pali_terms'):
+            parts.append(f"[Pali terms on this page: {', '.join(page_data['pali_terms'])}]\n\n")
+
+        parts += [
+            "THAI TEXT:\n",
+            page_data['thai_text'],
+            "\n\nENGLISH TRANSLATION:\n",
+            page_data['english_text'],
+            "\n\n" + "-"*70 + "\n",
+        ]
+        f.write("".join(parts))
+
+    @staticmethod
+    def _write_page_english(f, page_data: Dict):
+        """Write one page of the English-only output"""
+        if page_data['english_text'].strip():
+            f.write(f"[Page {page_data['page']}]\n{page_data['english_text']}\n\n")
+
+    def close(self):
+        """Stop the translation threads and flush and close the translation cache"""
+        self._translate_executor.shutdown()
+        self._cache.close()
 
-        results["all_pali_terms"] = sorted(list(all_pali_terms))
+    def save_results(self, results: Dict):
+        """Save translation results in multiple formats
 
-        return results
+        The pages themselves were streamed out by process_pdf; this writes the
+        summary-dependent files around them, one page at a time, and removes
+        the intermediates. Calling it again for the same run is a no-op.
+        """
+        if "error" in results:
+            return
 
-    def save_results(self, results: Dict):
-        """Save translation results in multiple formats"""
+        if not self.pages_file.exists():
+            print(f"\nNo pending pages for {self.base_name}; results already saved")
+            return
 
-        # 1. Save as JSON
+        # 1. Save as JSON (same layout as json.dump(..., indent=2))
         json_file = self.output_dir / f"{self.base_name}_translation.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        with open(json_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f, \
+                open(self.pages_file, encoding='utf-8') as pages_in:
+            f.write("{\n")
+            for key in ("source_file", "total_pages", "processed_pages"):
+                f.write(f"  {_dumps_json(key)}: {_dumps_json(results[key])},\n")
+
+            f.write('  "pages": [')
+            separator = "\n    "
+            for line in pages_in:
+                page_json = _dumps_json(_loads_json(line), indent=True)
+                f.write(separator + page_json.replace("\n", "\n    "))
+                separator = ",\n    "
+            if separator != "\n    ":
+                f.write("\n  ")
+            f.write("],\n")
+
+            all_pali_terms = _dumps_json(results['all_pali_terms'],
+                                         indent=True).replace("\n", "\n  ")
+            f.write(f'  "all_pali_terms": {all_pali_terms}\n')
+            f.write("}")
+        self.pages_file.unlink()
         print(f"\n✓ Saved JSON: {json_file}")
 
-        # 2. Save as readable text
+        # 2. Save as readable text (header first, then the streamed pages)
         txt_file = self.output_dir / f"{self.base_name}_translation.txt"
-        with open(txt_file, 'w', encoding='utf-8') as f:
+        with open(txt_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
             f.write(f"Translation of: {results['source_file']}\n")
             f.write(f"{'='*70}\n\n")
 
@@ -236,32 +914,16 @@ class AbhidhammaTranslator:
                 f.write(", ".join(results['all_pali_terms']))
                 f.write("\n\n" + "="*70 + "\n\n")
 
-            for page_data in results['pages']:
-                f.write(f"\n--- Page {page_data['page']} ---\n\n")
-
-                if page_data.get('pali_terms'):
-                    f.write(f"[Pali terms on this page: {', '.join(page_data['pali_terms'])}]\n\n")
-
-                f.write("THAI TEXT:\n")
-                f.write(page_data['thai_text'])
-                f.write("\n\nENGLISH TRANSLATION:\n")
-                f.write(page_data['english_text'])
-                f.write("\n\n" + "-"*70 + "\n")
+            with open(self._text_body_file, encoding='utf-8') as body:
+                shutil.copyfileobj(body, f, OUTPUT_BUFFER_SIZE)
+        self._text_body_file.unlink()
 
         print(f"✓ Saved Text: {txt_file}")
 
-        # 3. Save English-only version
+        # 3. English-only version was written page by page; swap it in only
+        # now, so a failed run leaves the previous complete file in place
         eng_file = self.output_dir / f"{self.base_name}_english.txt"
-        with open(eng_file, 'w', encoding='utf-8') as f:
-            f.write(f"English Translation of: {results['source_file']}\n")
-            f.write(f"{'='*70}\n\n")
-
-            for page_data in results['pages']:
-                if page_data['english_text'].strip():
-                    f.write(f"[Page {page_data['page']}]\n")
-                    f.write(page_data['english_text'])
-                    f.write("\n\n")
-
+        self._english_part_file.replace(eng_file)
         print(f"✓ Saved English: {eng_file}")
 
 
@@ -295,6 +957,7 @@ def main():
         translator = AbhidhammaTranslator(pdf_path)
         results = translator.process_pdf(max_pages=max_pages)
         translator.save_results(results)
+        translator.close()
     else:
         # Process all PDFs (with page limit for testing)
         print("\nProcessing all PDF files...")
@@ -308,6 +971,7 @@ def main():
                 translator = AbhidhammaTranslator(pdf_file)
                 results = translator.process_pdf(max_pages=max_pages)
                 translator.save_results(results)
+                translator.close()
                 print()
 
     print("\n" + "="*70)